@@ -0,0 +1,28 @@
+"""Console entry point for governance-kit.
+
+Handles ``--version`` without importing Click, then defers to the full CLI.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from . import __version__
+
+VERSION_FLAGS = ("--version", "-V")
+VERSION_MESSAGE = f"governance-kit {__version__}"
+
+
+def main() -> None:
+    """Run the governance CLI."""
+    if len(sys.argv) == 2 and sys.argv[1] in VERSION_FLAGS:
+        print(VERSION_MESSAGE)
+        sys.exit(0)
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,65 @@
 
 from __future__ import annotations
 
-import shutil
-import subprocess
+import errno
+import functools
+import importlib
+import re
 import sys
-from datetime import datetime
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import click
 
-from .overlay import apply_governance_overlay, check_governance_overlay
+from . import __version__
+
+# Subcommands are resolved on first use so that `governance --help` and
+# shell completion don't pay for importing overlay logic.
+LAZY_SUBCOMMANDS = {
+    "init": "governance.cli_init:init",
+    "check": "governance.cli_check:check",
+}
+
+# Shared by subcommands that operate on a project's .specify/ directory
+root_option = click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=Path("."),
+    show_default=True,
+    help="Project root containing .specify/",
+)
+
+# Common template placeholders left in an unfilled constitution.md
+TEMPLATE_MARKERS = (
+    "[PROJECT_NAME]",
+    "[PRINCIPLE_1_NAME]",
+    "[PRINCIPLE_2_NAME]",
+    "[YOUR_PROJECT]",
+    "[TEAM_NAME]",
+    "TODO:",
+    "FIXME:",
+)
 
+# One alternation so the constitution is scanned once rather than once per marker.
+# Compiled over bytes: the markers are ASCII, so the file never needs decoding.
+_TEMPLATE_MARKER_RE = re.compile(
+    b"|".join(re.escape(marker.encode("ascii")) for marker in TEMPLATE_MARKERS)
+)
 
+
+@functools.lru_cache(maxsize=1)
 def find_specify_executable() -> str | None:
     """Find the specify executable, checking common install locations.
 
+    The result is cached for the life of the process; call
+    ``find_specify_executable.cache_clear()`` after changing PATH.
+
     Returns:
         Path to specify executable or None if not found.
     """
+    import shutil
+
     # First check if it's in PATH
     specify_path = shutil.which("specify")
     if specify_path:
@@ -39,41 +81,92 @@ def is_constitution_customized(constitution_path: Path) -> bool:
     Returns:
         True if constitution has custom content, False if it's still a template
     """
-    if not constitution_path.exists():
-        return False
-
     try:
-        content = constitution_path.read_text(encoding="utf-8")
-    except (UnicodeDecodeError, PermissionError, OSError):
+        content = constitution_path.read_bytes()
+    except FileNotFoundError:
+        return False
+    except (PermissionError, OSError):
         # If we can't read the file, assume it's customized to be safe
         return True
 
-    # Check for common template placeholders
-    template_markers = [
-        "[PROJECT_NAME]",
-        "[PRINCIPLE_1_NAME]",
-        "[PRINCIPLE_2_NAME]",
-        "[YOUR_PROJECT]",
-        "[TEAM_NAME]",
-        "TODO:",
-        "FIXME:",
-    ]
-
     # If any template marker is found, it's still a template
-    for marker in template_markers:
-        if marker in content:
-            return False
+    if _TEMPLATE_MARKER_RE.search(content):
+        return False
+
+    # Check if file has meaningful content (not just whitespace/headers).
+    # Stop at the first line of actual content beyond headers.
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith(b"#"):
+            return True
+
+    return False
+
+
+# FICLONE errnos meaning "this filesystem/platform can't reflink", as opposed
+# to a problem with one particular file
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY}
+)
+
+# _IOW(0x94, 9, int) on architectures using the generic ioctl encoding.
+# ppc, mips and sparc encode the direction bits differently.
+_GENERIC_IOCTL_MACHINES = ("x86_64", "amd64", "i386", "i686", "aarch64", "arm", "riscv", "s390")
+
+
+def _ficlone_request() -> int | None:
+    """Return the FICLONE ioctl number, or None if it isn't known here."""
+    import fcntl
+    import platform
+
+    # fcntl.FICLONE is only exposed on Python 3.12+
+    ficlone: int | None = getattr(fcntl, "FICLONE", None)
+    if ficlone is None and platform.machine().lower().startswith(_GENERIC_IOCTL_MACHINES):
+        ficlone = 0x40049409
+    return ficlone
+
+
+def make_clone_function() -> Callable[[str, str], None]:
+    """Build a copy function that shares data blocks with the source where possible.
+
+    On Linux copy-on-write filesystems (btrfs, XFS, bcachefs) each copy is made
+    with a FICLONE reflink, which is a metadata-only operation. Unlike a hardlink,
+    the clone is a separate inode, so later in-place writes to the original don't
+    leak into the copy. Any other filesystem or platform falls back to a regular
+    copy.
+
+    The returned function remembers when the filesystem can't reflink and skips
+    the attempt for every later file, so build one per copy operation.
+
+    Returns:
+        A ``copy_function`` suitable for ``shutil.copytree``.
+    """
+    import shutil
 
-    # Check if file has meaningful content (not just whitespace/headers)
-    # Strip common markdown headers and whitespace
-    lines = [
-        line.strip()
-        for line in content.split("\n")
-        if line.strip() and not line.strip().startswith("#")
-    ]
+    ficlone = _ficlone_request() if sys.platform == "linux" else None
 
-    # If there's actual content beyond headers, consider it customized
-    return len(lines) > 0
+    def clone_file(src: str, dst: str) -> None:
+        nonlocal ficlone
+
+        if ficlone is not None:
+            import fcntl
+
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), ficlone, fsrc.fileno())
+            except OSError as e:
+                # Not supported here (e.g. ext4, tmpfs, cross-device); copy instead
+                if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                    ficlone = None
+            else:
+                # Outside the try: a failure here must not fall through to copy2
+                # on a destination whose mode may already be read-only
+                shutil.copystat(src, dst)
+                return
+
+        shutil.copy2(src, dst)
+
+    return clone_file
 
 
 def backup_specify_directory(specify_dir: Path) -> Path:
@@ -88,19 +181,20 @@ def backup_specify_directory(specify_dir: Path) -> Path:
     Raises:
         OSError: If backup cannot be created due to filesystem issues
     """
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    import shutil
+    import time
+
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
     backup_path = specify_dir.parent / f".specify-backup-{timestamp}"
 
     # Check if backup path already exists
     if backup_path.exists():
         # Add a suffix to make it unique
-        import time
-
         suffix = int(time.time() * 1000) % 1000
         backup_path = specify_dir.parent / f".specify-backup-{timestamp}-{suffix}"
 
     try:
-        shutil.copytree(specify_dir, backup_path)
+        shutil.copytree(specify_dir, backup_path, copy_function=make_clone_function())
     except (OSError, PermissionError) as e:
         msg = f"Failed to create backup: {e}"
         raise OSError(msg) from e
@@ -108,7 +202,39 @@ def backup_specify_directory(specify_dir: Path) -> Path:
     return backup_path
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are requested."""
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # Mapping of command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        base = super().list_commands(ctx)
+        return base + sorted(self.lazy_subcommands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        modname, attr = import_path.rsplit(":", 1)
+        cmd_object = getattr(importlib.import_module(modname), attr)
+        if not isinstance(cmd_object, click.Command):
+            msg = f"Lazy loading of {import_path} failed: not a click.Command"
+            raise ValueError(msg)
+        return cmd_object
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, invoke_without_command=True)
+@click.version_option(
+    __version__, "--version", "-V", prog_name="governance-kit", message="%(prog)s %(version)s"
+)
 @click.pass_context
 def main(ctx: click.Context) -> None:
     """Governance-enhanced Spec Kit CLI.
@@ -119,186 +245,5 @@ def main(ctx: click.Context) -> None:
         click.echo(ctx.get_help())
 
 
-@main.command()
-@click.option("--dry-run", is_flag=True, help="Simulate without making changes")
-@click.option("--force", is_flag=True, help="Force reinitialize even if .specify exists")
-@click.option(
-    "--skip-speckit",
-    is_flag=True,
-    help="Skip Spec Kit init (apply overlay only to existing .specify)",
-)
-@click.option(
-    "--ai",
-    type=str,
-    default="copilot",
-    help="AI assistant (claude, gemini, copilot, etc.)",
-)
-@click.option(
-    "--destroy-content",
-    is_flag=True,
-    help="Allow overwriting customized constitution.md (DANGEROUS - data loss!)",
-)
-def init(
-    dry_run: bool, force: bool, skip_speckit: bool, ai: str, destroy_content: bool
-) -> None:
-    """Initialize repository with Spec Kit + Governance overlay.
-
-    This command will:
-    1. Run 'specify init --here --ai <ai>' if not skipped
-    2. Copy governance rules to .specify/memory/governance/
-    3. Append rules to constitution.md
-    """
-    specify_dir = Path(".specify")
-
-    # Step 1: Run Spec Kit init if needed
-    if not skip_speckit:
-        if specify_dir.exists() and not force:
-            click.echo("ℹ️  .specify/ already exists. Use --force to reinitialize.")
-        else:
-            # CRITICAL: Check for customized constitution before destructive operation
-            constitution = specify_dir / "memory" / "constitution.md"
-            if specify_dir.exists() and is_constitution_customized(constitution):
-                if not destroy_content:
-                    click.echo(
-                        "⚠️  WARNING: Existing constitution.md detected with custom content!",
-                        err=True,
-                    )
-                    click.echo(
-                        "   Running 'specify init --force' would DESTROY your filled-in "
-                        "constitution.",
-                        err=True,
-                    )
-                    click.echo("", err=True)
-                    click.echo("Options:", err=True)
-                    click.echo(
-                        "  1. Use 'governance init --skip-speckit' to apply overlay only "
-                        "(RECOMMENDED)",
-                        err=True,
-                    )
-                    click.echo(
-                        "  2. Use '--destroy-content --force' to overwrite (DATA LOSS!)",
-                        err=True,
-                    )
-                    click.echo("", err=True)
-                    click.echo(
-                        "💡 Tip: If you want to preserve your content, use --skip-speckit",
-                        err=True,
-                    )
-                    sys.exit(1)
-                else:
-                    # User explicitly requested to destroy content - create backup first
-                    click.echo(
-                        "⚠️  --destroy-content flag detected. Creating backup...",
-                        err=True,
-                    )
-                    if not dry_run:
-                        try:
-                            backup_path = backup_specify_directory(specify_dir)
-                            click.echo(f"📦 Backed up .specify/ to {backup_path}")
-                        except OSError as e:
-                            click.echo(f"❌ Failed to create backup: {e}", err=True)
-                            click.echo(
-                                "   Cannot proceed without backup. Aborting.", err=True
-                            )
-                            sys.exit(1)
-
-            click.echo(f"📦 Running Spec Kit initialization (AI: {ai})...")
-            if not dry_run:
-                specify_exe = find_specify_executable()
-                cmd: list[str]
-
-                if specify_exe:
-                    cmd = [
-                        specify_exe,
-                        "init",
-                        "--here",
-                        "--force",
-                        "--ai",
-                        ai,
-                        "--ignore-agent-tools",
-                    ]
-                else:
-                    # Fallback to uvx
-                    click.echo("   (specify not found, using uvx...)")
-                    cmd = [
-                        "uvx",
-                        "--from",
-                        "git+https://github.com/github/spec-kit.git",
-                        "specify",
-                        "init",
-                        "--here",
-                        "--force",
-                        "--ai",
-                        ai,
-                        "--ignore-agent-tools",
-                    ]
-
-                # Run without capturing output to preserve TTY for interactive prompts
-                result = subprocess.run(cmd, check=False)
-
-                if result.returncode != 0:
-                    click.echo("❌ Spec Kit init failed.", err=True)
-                    sys.exit(1)
-                click.echo("✅ Spec Kit initialized.")
-
-    # Step 2: Validate .specify exists
-    if not specify_dir.exists():
-        click.echo(
-            "❌ .specify/ not found. Run 'specify init --here' first or remove --skip-speckit.",
-            err=True,
-        )
-        sys.exit(1)
-
-    # Step 3: Check if constitution.md exists
-    constitution = specify_dir / "memory" / "constitution.md"
-    if not constitution.exists():
-        click.echo(
-            "⚠️  constitution.md not found. Run '/speckit.constitution' in your AI agent first.",
-            err=True,
-        )
-        click.echo("   Then run 'governance init --skip-speckit' to apply the overlay.")
-        sys.exit(1)
-
-    # Step 4: Apply governance overlay
-    click.echo("🛡️  Applying Governance Overlay...")
-    if not dry_run:
-        try:
-            applied = apply_governance_overlay(specify_dir)
-            if applied:
-                click.echo("✅ Governance overlay applied successfully.")
-            else:
-                click.echo("ℹ️  Governance overlay already present, skipping.")
-        except FileNotFoundError as e:
-            click.echo(f"❌ {e}", err=True)
-            sys.exit(1)
-    else:
-        click.echo("   (dry-run: no changes made)")
-
-
-@main.command()
-def check() -> None:
-    """Check if governance overlay is applied correctly.
-
-    Validates that:
-    - constitution.md exists and contains overlay marker
-    - governance/ directory exists with rule files
-    """
-    specify_dir = Path(".specify")
-
-    if not specify_dir.exists():
-        click.echo("❌ .specify/ not found. Run 'governance init' first.", err=True)
-        sys.exit(1)
-
-    issues = check_governance_overlay(specify_dir)
-
-    if issues:
-        click.echo("Governance overlay issues found:")
-        for issue in issues:
-            click.echo(f"  ⚠️  {issue}")
-        sys.exit(1)
-    else:
-        click.echo("✅ Governance overlay is properly configured.")
-
-
 if __name__ == "__main__":
     main()
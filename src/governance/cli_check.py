@@ -0,0 +1,38 @@
+"""The 'governance check' command."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+
+from .cli import root_option
+
+
+@click.command()
+@root_option
+def check(root: Path) -> None:
+    """Check if governance overlay is applied correctly.
+
+    Validates that:
+    - constitution.md exists and contains overlay marker
+    - governance/ directory exists with rule files
+    """
+    from .overlay import check_governance_overlay
+
+    specify_dir = root / ".specify"
+
+    if not specify_dir.exists():
+        click.echo("❌ .specify/ not found. Run 'governance init' first.", err=True)
+        sys.exit(1)
+
+    issues = check_governance_overlay(specify_dir)
+
+    if issues:
+        click.echo("Governance overlay issues found:")
+        for issue in issues:
+            click.echo(f"  ⚠️  {issue}")
+        sys.exit(1)
+    else:
+        click.echo("✅ Governance overlay is properly configured.")
@@ -0,0 +1,197 @@
+"""The 'governance init' command."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+
+from .cli import (
+    backup_specify_directory,
+    find_specify_executable,
+    is_constitution_customized,
+    root_option,
+)
+
+
+@click.command()
+@click.option("--dry-run", is_flag=True, help="Simulate without making changes")
+@click.option("--force", is_flag=True, help="Force reinitialize even if .specify exists")
+@click.option(
+    "--skip-speckit",
+    is_flag=True,
+    help="Skip Spec Kit init (apply overlay only to existing .specify)",
+)
+@click.option(
+    "--ai",
+    type=str,
+    default="copilot",
+    help="AI assistant (claude, gemini, copilot, etc.)",
+)
+@click.option(
+    "--destroy-content",
+    is_flag=True,
+    help="Allow overwriting customized constitution.md (DANGEROUS - data loss!)",
+)
+@root_option
+def init(
+    dry_run: bool,
+    force: bool,
+    skip_speckit: bool,
+    ai: str,
+    destroy_content: bool,
+    root: Path,
+) -> None:
+    """Initialize repository with Spec Kit + Governance overlay.
+
+    This command will:
+    1. Run 'specify init --here --ai <ai>' if not skipped
+    2. Copy governance rules to .specify/memory/governance/
+    3. Append rules to constitution.md
+    """
+    from .overlay import apply_governance_overlay
+
+    specify_dir = root / ".specify"
+    # Probe once; only a successful 'specify init' below can change this
+    specify_exists = specify_dir.exists()
+
+    # Step 1: Run Spec Kit init if needed
+    if not skip_speckit:
+        if specify_exists and not force:
+            click.echo("ℹ️  .specify/ already exists. Use --force to reinitialize.")
+        else:
+            # CRITICAL: Check for customized constitution before destructive operation
+            constitution = specify_dir / "memory" / "constitution.md"
+            if specify_exists and is_constitution_customized(constitution):
+                if not destroy_content:
+                    click.echo(
+                        "⚠️  WARNING: Existing constitution.md detected with custom content!",
+                        err=True,
+                    )
+                    click.echo(
+                        "   Running 'specify init --force' would DESTROY your filled-in "
+                        "constitution.",
+                        err=True,
+                    )
+                    click.echo("", err=True)
+                    click.echo("Options:", err=True)
+                    click.echo(
+                        "  1. Use 'governance init --skip-speckit' to apply overlay only "
+                        "(RECOMMENDED)",
+                        err=True,
+                    )
+                    click.echo(
+                        "  2. Use '--destroy-content --force' to overwrite (DATA LOSS!)",
+                        err=True,
+                    )
+                    click.echo("", err=True)
+                    click.echo(
+                        "💡 Tip: If you want to preserve your content, use --skip-speckit",
+                        err=True,
+                    )
+                    sys.exit(1)
+                else:
+                    # User explicitly requested to destroy content - create backup first
+                    click.echo(
+                        "⚠️  --destroy-content flag detected. Creating backup...",
+                        err=True,
+                    )
+                    if not dry_run:
+                        try:
+                            backup_path = backup_specify_directory(specify_dir)
+                            click.echo(f"📦 Backed up .specify/ to {backup_path}")
+                        except OSError as e:
+                            click.echo(f"❌ Failed to create backup: {e}", err=True)
+                            click.echo(
+                                "   Cannot proceed without backup. Aborting.", err=True
+                            )
+                            sys.exit(1)
+
+            click.echo(f"📦 Running Spec Kit initialization (AI: {ai})...")
+            if not dry_run:
+                specify_exe = find_specify_executable()
+                cmd: list[str]
+
+                if specify_exe:
+                    cmd = [
+                        specify_exe,
+                        "init",
+                        "--here",
+                        "--force",
+                        "--ai",
+                        ai,
+                        "--ignore-agent-tools",
+                    ]
+                else:
+                    # Fallback to uvx. Resolve it up front so a missing uvx gets a
+                    # clear error instead of a FileNotFoundError from subprocess.
+                    import shutil
+
+                    uvx_exe = shutil.which("uvx")
+                    if not uvx_exe:
+                        click.echo(
+                            "❌ Neither specify nor uvx found on PATH. Install Spec Kit first.",
+                            err=True,
+                        )
+                        sys.exit(1)
+                    click.echo("   (specify not found, using uvx...)")
+                    cmd = [
+                        uvx_exe,
+                        "--from",
+                        "git+https://github.com/github/spec-kit.git",
+                        "specify",
+                        "init",
+                        "--here",
+                        "--force",
+                        "--ai",
+                        ai,
+                        "--ignore-agent-tools",
+                    ]
+
+                import subprocess
+
+                # Run without capturing output to preserve TTY for interactive prompts.
+                # With no preexec_fn, CPython launches the child via vfork on Linux.
+                # Don't start a new session here: it would detach the child from
+                # the terminal.
+                result = subprocess.run(cmd, check=False, cwd=root)
+
+                if result.returncode != 0:
+                    click.echo("❌ Spec Kit init failed.", err=True)
+                    sys.exit(1)
+                click.echo("✅ Spec Kit initialized.")
+                specify_exists = specify_dir.exists()
+
+    # Step 2: Validate .specify exists
+    if not specify_exists:
+        click.echo(
+            "❌ .specify/ not found. Run 'specify init --here' first or remove --skip-speckit.",
+            err=True,
+        )
+        sys.exit(1)
+
+    # Step 3: Check if constitution.md exists
+    constitution = specify_dir / "memory" / "constitution.md"
+    if not constitution.exists():
+        click.echo(
+            "⚠️  constitution.md not found. Run '/speckit.constitution' in your AI agent first.",
+            err=True,
+        )
+        click.echo("   Then run 'governance init --skip-speckit' to apply the overlay.")
+        sys.exit(1)
+
+    # Step 4: Apply governance overlay
+    click.echo("🛡️  Applying Governance Overlay...")
+    if not dry_run:
+        try:
+            applied = apply_governance_overlay(specify_dir)
+            if applied:
+                click.echo("✅ Governance overlay applied successfully.")
+            else:
+                click.echo("ℹ️  Governance overlay already present, skipping.")
+        except FileNotFoundError as e:
+            click.echo(f"❌ {e}", err=True)
+            sys.exit(1)
+    else:
+        click.echo("   (dry-run: no changes made)")
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import mmap
+import os
 from importlib.resources import files
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, overload
 
 if TYPE_CHECKING:
     from importlib.abc import Traversable
 
 # Marker to detect if overlay is already applied
 OVERLAY_MARKER = "# --- 🏛️ GOVERNANCE OVERLAY ---"
+# Encoded once at import; marker checks search raw file bytes
+OVERLAY_MARKER_BYTES = OVERLAY_MARKER.encode("utf-8")
+
+# How much of the end of constitution.md to search before scanning all of it.
+# Comfortably larger than the appended overlay section.
+_TAIL_SCAN_BYTES = 16 * 1024
 
 
 def get_rules_dir() -> Traversable:
@@ -22,7 +31,69 @@ def get_rules_dir() -> Traversable:
     return files("governance") / "rules"
 
 
-def apply_governance_overlay(specify_dir: Path) -> bool:
+@functools.cache
+def _load_rules() -> dict[str, str]:
+    """Read the bundled rule files once per process.
+
+    The rules ship inside the package and never change at runtime. Loading is
+    deferred to the first call so importing this module stays cheap.
+
+    Returns:
+        Mapping of rule file name to its content.
+    """
+    return {
+        p.name: p.read_text()
+        for p in get_rules_dir().iterdir()
+        if p.is_file() and p.name.endswith(".md")
+    }
+
+
+def has_overlay_marker(constitution: Path) -> bool:
+    """Check if constitution.md already contains the overlay marker.
+
+    The file is searched as raw bytes through a read-only memory map, so it
+    is never decoded. The overlay is appended, so the end of the file is
+    searched first and the rest is only scanned (and paged in) on a miss.
+
+    Args:
+        constitution: Path to constitution.md file
+
+    Returns:
+        True if the overlay marker is present.
+    """
+    with open(constitution, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tail_start = max(0, len(mm) - _TAIL_SCAN_BYTES)
+                if mm.find(OVERLAY_MARKER_BYTES, tail_start) != -1:
+                    return True
+                # Content may have been added after the overlay; check the rest
+                head_end = tail_start + len(OVERLAY_MARKER_BYTES) - 1
+                return tail_start > 0 and mm.find(OVERLAY_MARKER_BYTES, 0, head_end) != -1
+        except ValueError:
+            # Empty files cannot be mapped
+            return False
+
+
+@overload
+def apply_governance_overlay(
+    specify_dir: Path, *, return_content: Literal[False] = ...
+) -> bool: ...
+
+
+@overload
+def apply_governance_overlay(specify_dir: Path, *, return_content: Literal[True]) -> str | None: ...
+
+
+@overload
+def apply_governance_overlay(
+    specify_dir: Path, *, return_content: bool = ...
+) -> bool | str | None: ...
+
+
+def apply_governance_overlay(
+    specify_dir: Path, *, return_content: bool = False
+) -> bool | str | None:
     """Apply governance rules to a Spec Kit initialized repository.
 
     Copies bundled governance rules to .specify/memory/governance/
@@ -30,9 +101,12 @@ def apply_governance_overlay(specify_dir: Path) -> bool:
 
     Args:
         specify_dir: Path to .specify/ directory
+        return_content: Return the appended section instead of a bool
 
     Returns:
-        True if overlay was applied, False if already present.
+        True if overlay was applied, False if already present. With
+        return_content, the text appended to constitution.md, or None if
+        the overlay was already present.
 
     Raises:
         FileNotFoundError: If constitution.md doesn't exist
@@ -47,35 +121,31 @@ def apply_governance_overlay(specify_dir: Path) -> bool:
         raise FileNotFoundError(msg)
 
     # Check if already applied (idempotent)
-    content = constitution.read_text()
-    if OVERLAY_MARKER in content:
-        return False  # Already applied
+    if has_overlay_marker(constitution):
+        return None if return_content else False  # Already applied
 
     # Create governance directory
     gov_dir.mkdir(exist_ok=True)
 
     # Copy rule files from bundled package data
-    rules_source = get_rules_dir()
+    bundled_rules = _load_rules()
     rule_files = ["architecture.md", "stack.md", "process.md"]
 
+    rules_content: dict[str, str] = {}
     for rule_name in rule_files:
-        source = rules_source / rule_name
-        # Check if source exists (as Traversable)
-        try:
-            source_content = source.read_text()
-            (gov_dir / rule_name).write_text(source_content)
-        except FileNotFoundError:
+        source_content = bundled_rules.get(rule_name)
+        if source_content is None:
             # Rule file not bundled, skip
-            pass
+            continue
+        # Binary write: one buffer, no newline translation or locale encoding
+        (gov_dir / rule_name).write_bytes(source_content.encode("utf-8"))
+        rules_content[rule_name] = source_content
 
-    # Build governance section content
+    # Build governance section content from the rules just copied
     sections = []
-    for rule_name in rule_files:
-        rule_path = gov_dir / rule_name
-        if rule_path.exists():
-            rule_content = rule_path.read_text().strip()
-            section_name = rule_name.replace(".md", "").title()
-            sections.append(f"## {section_name} Governance\n\n{rule_content}")
+    for rule_name, rule_content in rules_content.items():
+        section_name = rule_name.replace(".md", "").title()
+        sections.append(f"## {section_name} Governance\n\n{rule_content.strip()}")
 
     if not sections:
         # No rules to add, create placeholder
@@ -84,23 +154,29 @@ def apply_governance_overlay(specify_dir: Path) -> bool:
             "*Add rules to `.specify/memory/governance/` directory.*"
         )
 
+    rules_text = "\n".join(sections)
     governance_section = f"""
 
 {OVERLAY_MARKER}
 
 The following governance rules are **non-negotiable** and apply to all development phases.
 
-{chr(10).join(sections)}
+{rules_text}
 
 ---
 *Governance overlay applied by governance-kit*
 """
 
-    # Append to constitution
-    with open(constitution, "a") as f:
-        f.write(governance_section)
+    # Append to constitution as one pre-encoded write
+    payload = memoryview(governance_section.encode("utf-8"))
+    fd = os.open(constitution, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
 
-    return True
+    return governance_section if return_content else True
 
 
 def check_governance_overlay(specify_dir: Path) -> list[str]:
@@ -118,7 +194,7 @@ def check_governance_overlay(specify_dir: Path) -> list[str]:
 
     if not constitution.exists():
         issues.append("constitution.md not found")
-    elif OVERLAY_MARKER not in constitution.read_text():
+    elif not has_overlay_marker(constitution):
         issues.append("Governance overlay not in constitution.md")
 
     if not gov_dir.exists():
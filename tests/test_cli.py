@@ -2,72 +2,124 @@
 
 from __future__ import annotations
 
+import errno
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from governance.cli import main
-from governance.overlay import OVERLAY_MARKER
+from governance import __version__
+from governance.__main__ import main as entry_point
+from governance.cli import (
+    backup_specify_directory,
+    find_specify_executable,
+    is_constitution_customized,
+    main,
+)
+from governance.overlay import OVERLAY_MARKER_BYTES, apply_governance_overlay
 
+BASE_CONSTITUTION = b"# Project Constitution\n\n## Principles\n"
+CUSTOM_CONTENT = "# My Project\n\n## Core Values\n\nWe value quality."
+CUSTOM_CONTENT_BYTES = CUSTOM_CONTENT.encode()
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def _chdir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Run every test from an empty directory beside its project; the cwd is restored afterwards.
+
+    Keeping the cwd apart from tmp_path makes sure --root is actually honoured.
+    """
+    cwd = tmp_path / "cwd"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+
+
+@pytest.fixture(autouse=True)
+def _clear_specify_cache() -> Iterator[None]:
+    """Forget any cached specify lookup so PATH changes take effect."""
+    find_specify_executable.cache_clear()
+    yield
+    find_specify_executable.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
-    """Create a CLI test runner."""
-    return CliRunner()
+    """Create a CLI test runner shared across the test session.
 
+    Unexpected exceptions propagate instead of being folded into the result.
+    """
+    return CliRunner(catch_exceptions=False)
 
-@pytest.fixture
-def mock_specify_with_constitution(tmp_path: Path) -> Path:
-    """Create a mock .specify directory with constitution.md."""
-    specify_dir = tmp_path / ".specify"
-    memory_dir = specify_dir / "memory"
+
+@pytest.fixture(scope="session")
+def _specify_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the mock project tree once per session."""
+    root = tmp_path_factory.mktemp("specify_template")
+    memory_dir = root / ".specify" / "memory"
     memory_dir.mkdir(parents=True)
 
     constitution = memory_dir / "constitution.md"
-    constitution.write_text("# Project Constitution\n\n## Principles\n")
+    constitution.write_bytes(BASE_CONSTITUTION)
 
-    return tmp_path
+    return root
 
 
-class TestCheckCommand:
-    """Tests for the 'governance check' command."""
+@pytest.fixture
+def mock_specify_with_constitution(tmp_path: Path, _specify_template: Path) -> Path:
+    """Create a mock .specify directory with constitution.md."""
+    shutil.copytree(_specify_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
 
-    def test_check_fails_when_no_specify_dir(self, runner: CliRunner) -> None:
-        """Test check fails when .specify doesn't exist."""
-        with runner.isolated_filesystem():
-            result = runner.invoke(main, ["check"])
 
-            assert result.exit_code == 1
-            assert ".specify/ not found" in result.output
+def _make_specify(root: Path) -> None:
+    """Create an un-overlaid .specify tree under root."""
+    memory_dir = root / ".specify" / "memory"
+    memory_dir.mkdir(parents=True)
+    (memory_dir / "constitution.md").write_bytes(BASE_CONSTITUTION)
 
-    def test_check_fails_when_no_overlay(
-        self, runner: CliRunner, mock_specify_with_constitution: Path
-    ) -> None:
-        """Test check fails when overlay not applied."""
-        import os
-        os.chdir(mock_specify_with_constitution)
 
-        result = runner.invoke(main, ["check"])
+def _make_applied_specify(root: Path) -> None:
+    """Create a .specify tree under root with the overlay applied."""
+    _make_specify(root)
+    apply_governance_overlay(root / ".specify")
 
-        assert result.exit_code == 1
-        assert "Governance overlay not in constitution.md" in result.output
 
-    def test_check_passes_when_overlay_applied(
-        self, runner: CliRunner, mock_specify_with_constitution: Path
-    ) -> None:
-        """Test check passes after overlay is applied."""
-        import os
-        os.chdir(mock_specify_with_constitution)
+class TestCheckCommand:
+    """Tests for the 'governance check' command."""
 
-        # Apply overlay first
-        from governance.overlay import apply_governance_overlay
-        apply_governance_overlay(mock_specify_with_constitution / ".specify")
+    @pytest.mark.parametrize(
+        ("setup", "exit_code", "fragment"),
+        [
+            pytest.param(lambda root: None, 1, ".specify/ not found", id="no-specify-dir"),
+            pytest.param(
+                _make_specify, 1, "Governance overlay not in constitution.md", id="no-overlay"
+            ),
+            pytest.param(_make_applied_specify, 0, "properly configured", id="overlay-applied"),
+        ],
+    )
+    def test_check(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        setup: Callable[[Path], None],
+        exit_code: int,
+        fragment: str,
+    ) -> None:
+        """Test check's exit code and message for each project state."""
+        project = tmp_path / "proj"
+        project.mkdir()
+        setup(project)
 
-        result = runner.invoke(main, ["check"])
+        result = runner.invoke(main, ["check", "--root", str(project)])
 
-        assert result.exit_code == 0
-        assert "properly configured" in result.output
+        assert result.exit_code == exit_code
+        assert fragment in result.output
 
 
 class TestInitCommand:
@@ -77,13 +129,19 @@ class TestInitCommand:
         self, runner: CliRunner, mock_specify_with_constitution: Path
     ) -> None:
         """Test --dry-run doesn't modify files."""
-        import os
-        os.chdir(mock_specify_with_constitution)
-
         constitution = mock_specify_with_constitution / ".specify" / "memory" / "constitution.md"
         original_content = constitution.read_text()
 
-        result = runner.invoke(main, ["init", "--skip-speckit", "--dry-run"])
+        result = runner.invoke(
+            main,
+            [
+                "init",
+                "--skip-speckit",
+                "--dry-run",
+                "--root",
+                str(mock_specify_with_constitution),
+            ],
+        )
 
         assert result.exit_code == 0
         assert "dry-run" in result.output
@@ -93,86 +151,142 @@ class TestInitCommand:
         self, runner: CliRunner, mock_specify_with_constitution: Path
     ) -> None:
         """Test init applies overlay when --skip-speckit is used."""
-        import os
-        os.chdir(mock_specify_with_constitution)
-
-        result = runner.invoke(main, ["init", "--skip-speckit"])
+        result = runner.invoke(
+            main, ["init", "--skip-speckit", "--root", str(mock_specify_with_constitution)]
+        )
 
         assert result.exit_code == 0
         assert "Governance overlay applied" in result.output
 
         constitution = mock_specify_with_constitution / ".specify" / "memory" / "constitution.md"
-        assert OVERLAY_MARKER in constitution.read_text()
+        assert OVERLAY_MARKER_BYTES in constitution.read_bytes()
 
     def test_init_skips_if_already_applied(
         self, runner: CliRunner, mock_specify_with_constitution: Path
     ) -> None:
         """Test init is idempotent."""
-        import os
-        os.chdir(mock_specify_with_constitution)
-
-        # Apply once
-        runner.invoke(main, ["init", "--skip-speckit"])
+        # Apply once, directly
+        apply_governance_overlay(mock_specify_with_constitution / ".specify")
 
-        # Apply again
-        result = runner.invoke(main, ["init", "--skip-speckit"])
+        # Apply again through the CLI
+        result = runner.invoke(
+            main, ["init", "--skip-speckit", "--root", str(mock_specify_with_constitution)]
+        )
 
         assert result.exit_code == 0
         assert "already present" in result.output
 
+    def test_init_fails_when_no_specify_or_uvx(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test init reports an error when neither specify nor uvx is installed."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        result = runner.invoke(main, ["init", "--root", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Neither specify nor uvx found" in result.output
+
+    def test_init_rejects_missing_root(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test init refuses a --root that doesn't exist instead of crashing."""
+        result = runner.invoke(main, ["init", "--root", str(tmp_path / "does-not-exist")])
+
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+
 
 class TestMainHelp:
     """Tests for help output."""
 
+    def test_help_lists_commands(self) -> None:
+        """Test that help text describes the CLI and lists subcommands."""
+        help_text = main.get_help(click.Context(main))
+
+        assert "Governance-enhanced Spec Kit CLI" in help_text
+        assert "init" in help_text
+        assert "check" in help_text
+
+    def test_help_does_not_import_overlay(self) -> None:
+        """Test that --help leaves the overlay logic unimported."""
+        script = (
+            "import sys\n"
+            "from governance.cli import main\n"
+            "main(['--help'], standalone_mode=False)\n"
+            "sys.exit('governance.overlay' in sys.modules)\n"
+        )
+        src_dir = Path(__file__).resolve().parents[1] / "src"
+        pythonpath = os.pathsep.join(filter(None, [str(src_dir), os.environ.get("PYTHONPATH")]))
+        env = {**os.environ, "PYTHONPATH": pythonpath}
+
+        result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True)
+
+        assert result.returncode == 0, result.stderr.decode()
+
     def test_shows_help_when_no_command(self, runner: CliRunner) -> None:
         """Test that help is shown when no subcommand given."""
         result = runner.invoke(main)
 
         assert result.exit_code == 0
         assert "Governance-enhanced Spec Kit CLI" in result.output
-        assert "init" in result.output
-        assert "check" in result.output
+
+
+class TestVersion:
+    """Tests for version output."""
+
+    def test_version_option(self, runner: CliRunner) -> None:
+        """Test that --version prints the package version."""
+        result = runner.invoke(main, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output.strip() == f"governance-kit {__version__}"
+
+    def test_entry_point_fast_path_matches_click(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the __main__ fast path prints the same version string."""
+        monkeypatch.setattr("sys.argv", ["governance", "--version"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            entry_point()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.strip() == f"governance-kit {__version__}"
 
 
 class TestConstitutionProtection:
     """Tests for constitution.md data loss protection."""
 
-    def test_detects_customized_constitution(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param("", False, id="empty"),
+            pytest.param("# [PROJECT_NAME]\n\n## [PRINCIPLE_1_NAME]", False, id="template"),
+            pytest.param(CUSTOM_CONTENT, True, id="custom"),
+        ],
+    )
+    def test_detects_customized_constitution(
+        self, tmp_path: Path, content: str, expected: bool
+    ) -> None:
         """Test that customized constitution is detected."""
-        from governance.cli import is_constitution_customized
-
         constitution = tmp_path / "constitution.md"
-        
-        # Empty file is not customized
-        constitution.write_text("")
-        assert not is_constitution_customized(constitution)
-
-        # File with template placeholders is not customized
-        constitution.write_text("# [PROJECT_NAME]\n\n## [PRINCIPLE_1_NAME]")
-        assert not is_constitution_customized(constitution)
+        constitution.write_text(content)
 
-        # File with actual content is customized
-        constitution.write_text("# My Project\n\n## Core Values\n\nWe value quality.")
-        assert is_constitution_customized(constitution)
+        assert is_constitution_customized(constitution) is expected
 
     def test_prevents_overwriting_customized_constitution(
         self, runner: CliRunner, tmp_path: Path
     ) -> None:
         """Test that init refuses to overwrite customized constitution without --destroy-content."""
-        import os
-
         # Setup: create .specify with customized constitution
         specify_dir = tmp_path / ".specify"
         memory_dir = specify_dir / "memory"
         memory_dir.mkdir(parents=True)
 
         constitution = memory_dir / "constitution.md"
-        constitution.write_text("# My Project\n\n## Core Values\n\nWe value quality.")
-
-        os.chdir(tmp_path)
+        constitution.write_bytes(CUSTOM_CONTENT_BYTES)
 
         # Try to run init with --force (should fail with protection)
-        result = runner.invoke(main, ["init", "--force"])
+        result = runner.invoke(main, ["init", "--force", "--root", str(tmp_path)])
 
         assert result.exit_code == 1
         assert "WARNING" in result.output
@@ -183,22 +297,17 @@ class TestConstitutionProtection:
         self, runner: CliRunner, tmp_path: Path
     ) -> None:
         """Test that --destroy-content flag allows overwrite with backup."""
-        import os
-
         # Setup: create .specify with customized constitution
         specify_dir = tmp_path / ".specify"
         memory_dir = specify_dir / "memory"
         memory_dir.mkdir(parents=True)
 
         constitution = memory_dir / "constitution.md"
-        original_content = "# My Project\n\n## Core Values\n\nWe value quality."
-        constitution.write_text(original_content)
-
-        os.chdir(tmp_path)
+        constitution.write_bytes(CUSTOM_CONTENT_BYTES)
 
         # Run with --destroy-content flag (should create backup)
         # Note: This will fail to actually run specify, but we're testing the backup logic
-        runner.invoke(main, ["init", "--force", "--destroy-content"])
+        runner.invoke(main, ["init", "--force", "--destroy-content", "--root", str(tmp_path)])
 
         # Check that backup was created
         backup_dirs = list(tmp_path.glob(".specify-backup-*"))
@@ -206,41 +315,81 @@ class TestConstitutionProtection:
         
         # Verify backup contains original content
         backup_constitution = backup_dirs[0] / "memory" / "constitution.md"
-        assert backup_constitution.read_text() == original_content
+        assert backup_constitution.read_text() == CUSTOM_CONTENT
+
+    def test_backup_is_independent_of_original(self, tmp_path: Path) -> None:
+        """Test that in-place writes to the original don't change the backup."""
+        specify_dir = tmp_path / ".specify"
+        memory_dir = specify_dir / "memory"
+        memory_dir.mkdir(parents=True)
+
+        constitution = memory_dir / "constitution.md"
+        constitution.write_bytes(CUSTOM_CONTENT_BYTES)
+
+        backup_path = backup_specify_directory(specify_dir)
+
+        # Append in place, as the overlay does
+        with open(constitution, "a") as f:
+            f.write("\nAppended later.")
+
+        backup_constitution = backup_path / "memory" / "constitution.md"
+        assert backup_constitution.read_text() == CUSTOM_CONTENT
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="FICLONE is Linux-only")
+    def test_backup_stops_reflinking_once_unsupported(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a filesystem without reflinks is only probed once per backup."""
+        specify_dir = tmp_path / ".specify"
+        memory_dir = specify_dir / "memory"
+        memory_dir.mkdir(parents=True)
+        for name in ("a.md", "b.md", "c.md"):
+            (memory_dir / name).write_bytes(CUSTOM_CONTENT_BYTES)
+
+        calls = 0
+
+        def _unsupported_ioctl(*args: object) -> None:
+            nonlocal calls
+            calls += 1
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        monkeypatch.setattr("fcntl.ioctl", _unsupported_ioctl)
+
+        backup_path = backup_specify_directory(specify_dir)
+
+        assert calls <= 1
+        for name in ("a.md", "b.md", "c.md"):
+            assert (backup_path / "memory" / name).read_bytes() == CUSTOM_CONTENT_BYTES
 
     def test_skip_speckit_bypasses_protection(
         self, runner: CliRunner, mock_specify_with_constitution: Path
     ) -> None:
         """Test that --skip-speckit bypasses the protection check."""
-        import os
-        os.chdir(mock_specify_with_constitution)
-
         # Add custom content to constitution
         constitution = mock_specify_with_constitution / ".specify" / "memory" / "constitution.md"
-        constitution.write_text("# My Project\n\n## Core Values\n\nWe value quality.")
+        constitution.write_bytes(CUSTOM_CONTENT_BYTES)
 
         # Should succeed with --skip-speckit
-        result = runner.invoke(main, ["init", "--skip-speckit"])
+        result = runner.invoke(
+            main, ["init", "--skip-speckit", "--root", str(mock_specify_with_constitution)]
+        )
 
         assert result.exit_code == 0
         assert "Governance overlay applied" in result.output
 
-    def test_handles_unreadable_constitution_safely(self, tmp_path: Path) -> None:
+    def test_handles_unreadable_constitution_safely(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that unreadable constitution is treated as customized for safety."""
-        from governance.cli import is_constitution_customized
-
         # Create a constitution file
         constitution = tmp_path / "constitution.md"
         constitution.write_text("# My Project")
 
-        # Make it unreadable (simulate permission error)
-        import os
-        os.chmod(constitution, 0o000)
-
-        try:
-            # Should return True (assume customized) for safety
-            result = is_constitution_customized(constitution)
-            assert result is True
-        finally:
-            # Restore permissions for cleanup
-            os.chmod(constitution, 0o644)
+        # Simulate a permission error; chmod 000 is still readable as root
+        def _raise_permission_error(self: Path) -> bytes:
+            raise PermissionError(self)
+
+        monkeypatch.setattr(Path, "read_bytes", _raise_permission_error)
+
+        # Should return True (assume customized) for safety
+        assert is_constitution_customized(constitution) is True